@@ -39,8 +39,8 @@ if (-not (Test-Path $venvPython)) {
 Write-Host "Upgrading pip/setuptools/wheel ..."
 & $venvPython -m pip install --upgrade pip setuptools wheel
 
-Write-Host "Installing faster-whisper ..."
-& $venvPython -m pip install faster-whisper
+Write-Host "Installing faster-whisper, orjson and soundfile ..."
+& $venvPython -m pip install "faster-whisper>=1.2" orjson soundfile
 
 Write-Host "Validating install ..."
 & $venvPython -c "import faster_whisper; print('faster-whisper version:', getattr(faster_whisper, '__version__', 'unknown'))"
@@ -41,7 +41,9 @@ Write-Host "Upgrading pip/setuptools/wheel ..."
 
 Write-Host "Installing Faster-Whisper and CUDA runtime wheels (cu12) ..."
 & $venvPython -m pip install --upgrade `
-  faster-whisper `
+  "faster-whisper>=1.2" `
+  orjson `
+  soundfile `
   nvidia-cublas-cu12 `
   nvidia-cudnn-cu12 `
   nvidia-cuda-runtime-cu12 `
@@ -0,0 +1,220 @@
+import base64
+import sys
+import threading
+import time
+import types
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import worker  # noqa: E402
+
+
+class FakeSegment:
+    def __init__(self, text: str, seek: int = 0):
+        self.text = text
+        self.start = 0.0
+        self.end = 1.0
+        self.seek = seek
+        self.avg_logprob = -0.2
+        self.no_speech_prob = 0.1
+        self.compression_ratio = 1.2
+
+
+class FakeWhisperModel:
+    frames_per_second = 100
+    load_delay_s = 0.0
+
+    def __init__(self, model_source, **kwargs):
+        time.sleep(self.load_delay_s)
+        self.model_source = model_source
+        self.kwargs = kwargs
+
+    def transcribe(self, audio, **kwargs):
+        return iter([FakeSegment("sequential")]), None
+
+
+def fake_download_model(model_id, local_files_only=False):
+    if model_id == "large-v3":
+        raise RuntimeError("large-v3 is not on disk")
+    return f"/models/{model_id}"
+
+
+@pytest.fixture
+def fake_faster_whisper(monkeypatch):
+    module = types.ModuleType("faster_whisper")
+    utils = types.ModuleType("faster_whisper.utils")
+    utils.download_model = fake_download_model
+    module.__version__ = "1.2.1"
+    module.utils = utils
+    module.WhisperModel = FakeWhisperModel
+    module.BatchedInferencePipeline = None
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+    monkeypatch.setitem(sys.modules, "faster_whisper.utils", utils)
+    monkeypatch.setattr(worker, "WhisperModel", None)
+    monkeypatch.setattr(worker, "BatchedInferencePipeline", None)
+    monkeypatch.setattr(worker, "download_model", None)
+    monkeypatch.setattr(worker, "MODEL_CACHE", OrderedDict())
+    monkeypatch.setattr(worker, "BATCH_PIPELINE_CACHE", {})
+    monkeypatch.setattr(worker, "MODEL_CACHE_SIZE", 2)
+    monkeypatch.setattr(
+        worker, "BACKEND_MAP", {"cpu": "cpu", "cuda": "cuda", "auto": "cuda"}
+    )
+    monkeypatch.setattr(
+        worker, "resolve_compute_type", lambda device, requested: requested
+    )
+    return module
+
+
+def test_cache_size_holds_under_concurrent_loads(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(worker, "MODEL_CACHE_SIZE", 1)
+    monkeypatch.setattr(FakeWhisperModel, "load_delay_s", 0.05)
+    threads = [
+        threading.Thread(target=worker.load_model, args=(model_id, "cuda", "int8"))
+        for model_id in worker.ALLOWED_MODEL_IDS
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(worker.MODEL_CACHE) == 1
+
+
+def test_cache_evicts_least_recently_used(fake_faster_whisper):
+    worker.load_model("small.en", "cpu", "int8")
+    worker.load_model("small.en", "cuda", "int8")
+    worker.load_model("small.en", "cpu", "int8")
+    worker.load_model("large-v3", "cuda", "int8")
+    assert list(worker.MODEL_CACHE) == [
+        ("small.en", "cpu", "int8"),
+        ("large-v3", "cuda", "int8"),
+    ]
+
+
+def test_evicted_model_is_freed_before_the_new_load(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(worker, "MODEL_CACHE_SIZE", 1)
+    model, _cache_hit, _load_ms = worker.load_model("small.en", "cuda", "int8")
+    evicted = weakref.ref(model)
+    del model
+    alive_during_load = []
+
+    class ProbeModel(FakeWhisperModel):
+        def __init__(self, model_source, **kwargs):
+            alive_during_load.append(evicted() is not None)
+            super().__init__(model_source, **kwargs)
+
+    monkeypatch.setattr(worker, "WhisperModel", ProbeModel)
+    worker.load_model("large-v3", "cuda", "int8")
+    assert alive_during_load == [False]
+
+
+def test_missing_local_weights_keep_cached_model(fake_faster_whisper, monkeypatch):
+    monkeypatch.setattr(worker, "MODEL_CACHE_SIZE", 1)
+    worker.load_model("small.en", "cuda", "int8")
+    with pytest.raises(RuntimeError):
+        worker.load_model("large-v3", "cuda", "int8", local_files_only=True)
+    assert list(worker.MODEL_CACHE) == [("small.en", "cuda", "int8")]
+
+
+def test_release_drops_matching_entries(fake_faster_whisper):
+    worker.load_model("small.en", "cpu", "int8")
+    worker.load_model("small.en", "cuda", "int8")
+    response = worker.release({"id": 7, "modelId": "small.en", "backendUsed": "cuda"})
+    assert response["released"] == [["small.en", "cuda", "int8"]]
+    assert list(worker.MODEL_CACHE) == [("small.en", "cpu", "int8")]
+
+
+def test_validate_request_rejects_unknown_models():
+    assert worker._validate_request({"modelId": "small.en"}) == ("small.en", None)
+    _model_id, missing = worker._validate_request({"id": 1})
+    assert missing == {"id": 1, "ok": False, "error": "Model ID is required."}
+    _model_id, unknown = worker._validate_request({"id": 2, "modelId": "tiny"})
+    assert unknown["ok"] is False
+    assert worker.ALLOWED_MODELS_HINT in unknown["error"]
+
+
+class FakeBatchedPipeline:
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, clip_timestamps, batch_size, **kwargs):
+        # Return segments out of order to check they are mapped back by seek.
+        frames_per_second = self.model.frames_per_second
+        segments = [
+            FakeSegment(f"clip {position}", int(clip["start"] * frames_per_second))
+            for position, clip in enumerate(clip_timestamps)
+        ]
+        return iter(reversed(segments)), None
+
+
+def pcm_request(request_id, seconds: float, **fields) -> dict:
+    samples = np.zeros(int(seconds * worker.SAMPLE_RATE_HZ), dtype=np.int16)
+    return {
+        "id": request_id,
+        "modelId": "small.en",
+        "audioPcm16B64": base64.b64encode(samples.tobytes()).decode("ascii"),
+        "vadFilter": False,
+        **fields,
+    }
+
+
+@pytest.fixture
+def emitted(fake_faster_whisper, monkeypatch):
+    fake_faster_whisper.BatchedInferencePipeline = FakeBatchedPipeline
+    frames = []
+    monkeypatch.setattr(worker, "emit", frames.append)
+    return frames
+
+
+def test_batch_maps_segments_back_to_requests(emitted):
+    worker._flush_transcribes([pcm_request(1, 1.5), pcm_request(2, 1.0)])
+    assert [(frame["id"], frame["text"], frame["batchSize"]) for frame in emitted] == [
+        (1, "clip 0", 2),
+        (2, "clip 1", 2),
+    ]
+
+
+def test_bad_request_does_not_drop_the_batch(emitted):
+    worker._flush_transcribes(
+        [
+            pcm_request(1, 1.0),
+            pcm_request(2, 1.0, sampleRateHz="abc"),
+            pcm_request(3, 1.0, beamSize="wide"),
+            pcm_request(4, 1.0),
+        ]
+    )
+    assert [(frame["id"], frame["ok"]) for frame in emitted] == [
+        (1, True),
+        (2, False),
+        (3, False),
+        (4, True),
+    ]
+
+
+def test_responses_follow_arrival_order(emitted):
+    worker._flush_transcribes(
+        [
+            pcm_request(1, 1.0),
+            pcm_request(2, 1.0, streaming=True),
+            pcm_request(3, 1.0),
+        ]
+    )
+    assert [(frame["id"], bool(frame.get("partial"))) for frame in emitted] == [
+        (1, False),
+        (2, True),
+        (2, False),
+        (3, False),
+    ]
+    assert emitted[2]["final"] is True
+
+
+def test_old_faster_whisper_disables_batching(emitted, fake_faster_whisper):
+    fake_faster_whisper.__version__ = "1.1.1"
+    worker._flush_transcribes([pcm_request(1, 1.0), pcm_request(2, 1.0)])
+    assert worker.BatchedInferencePipeline is None
+    assert [frame["text"] for frame in emitted] == ["sequential", "sequential"]
@@ -1,25 +1,95 @@
 import base64
 import ctypes
+import functools
+import gc
+import importlib.util
+import io
 import json
 import os
+import queue
+import re
 import sys
+import tempfile
+import threading
 import time
 import traceback
+import wave
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
-from faster_whisper import WhisperModel
 try:
-    import ctranslate2
+    import orjson
 except Exception:  # noqa: BLE001
-    ctranslate2 = None
+    orjson = None
+try:
+    import soundfile
+except Exception:  # noqa: BLE001
+    soundfile = None
+
 
+# faster_whisper and ctranslate2 take seconds to import on a cold start, so
+# they are loaded on first use and the ready handshake goes out first.
+WhisperModel = None
+BatchedInferencePipeline = None
+download_model = None
+ctranslate2 = None
+CTRANSLATE2_IMPORT_ATTEMPTED = False
 
-MODEL_CACHE = {}
-ALLOWED_MODELS = {"small.en", "large-v3"}
+MODEL_CACHE: OrderedDict = OrderedDict()
+WRITER_QUEUE: queue.Queue = queue.Queue(maxsize=64)
+MODEL_CACHE_LOCK = threading.Lock()
+MODEL_LOAD_LOCK = threading.Lock()
+BATCH_PIPELINE_CACHE = {}
+ALLOWED_MODEL_IDS = ("small.en", "large-v3")
+ALLOWED_MODELS = frozenset(ALLOWED_MODEL_IDS)
+ALLOWED_MODELS_HINT = f"Allowed: {', '.join(ALLOWED_MODEL_IDS)}"
 GPU_CAPABILITY_CACHE = None
+SUPPORTED_COMPUTE_TYPES_CACHE: dict[str, frozenset[str]] = {}
 CUDA_RUNTIME_LIBS_READY_CACHE = None
+BACKEND_MAP: dict[str, str] = {}
 CUDA_DLL_DIR_HANDLES = []
+CUDA_RUNTIME_DLLS = ["cublas64_12.dll"]
+LOAD_LIBRARY_SEARCH_DEFAULT_DIRS = 0x00001000
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+_PCM_SCRATCH: np.ndarray | None = None
+SAMPLE_RATE_HZ = 16_000
+WHISPER_WINDOW_SECONDS = 30
+
+
+def import_ctranslate2():
+    global ctranslate2, CTRANSLATE2_IMPORT_ATTEMPTED
+    if not CTRANSLATE2_IMPORT_ATTEMPTED:
+        try:
+            import ctranslate2 as ctranslate2_module
+        except Exception:  # noqa: BLE001
+            ctranslate2_module = None
+        ctranslate2 = ctranslate2_module
+        CTRANSLATE2_IMPORT_ATTEMPTED = True
+    return ctranslate2
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    match = re.match(r"(\d+)\.(\d+)", version)
+    return (int(match.group(1)), int(match.group(2))) if match else ()
+
+
+def import_faster_whisper() -> None:
+    global WhisperModel, BatchedInferencePipeline, download_model
+    if WhisperModel is not None:
+        return
+    import faster_whisper
+    from faster_whisper import WhisperModel as whisper_model
+    from faster_whisper.utils import download_model as download_model_fn
+
+    # _run_batch relies on clip_timestamps in seconds and one chunk per clip,
+    # which older releases do not provide (1.1 takes sample indices).
+    batched_pipeline = None
+    if _version_tuple(getattr(faster_whisper, "__version__", "")) >= (1, 2):
+        batched_pipeline = getattr(faster_whisper, "BatchedInferencePipeline", None)
+    BatchedInferencePipeline = batched_pipeline
+    download_model = download_model_fn
+    WhisperModel = whisper_model
 
 
 def _candidate_cuda_bin_dirs() -> list[str]:
@@ -38,6 +108,15 @@ def _candidate_cuda_bin_dirs() -> list[str]:
             if bin_dir.exists():
                 dirs.append(str(bin_dir))
 
+    # CTranslate2 wheels ship their own runtime DLLs next to the package.
+    # Locate it without importing so the probe stays cheap.
+    try:
+        ct2_spec = importlib.util.find_spec("ctranslate2")
+    except Exception:  # noqa: BLE001
+        ct2_spec = None
+    if ct2_spec is not None and ct2_spec.submodule_search_locations:
+        dirs.extend(ct2_spec.submodule_search_locations)
+
     deduped = []
     seen = set()
     for value in dirs:
@@ -81,6 +160,42 @@ def env_flag(name: str, default_value: bool) -> bool:
     return default_value
 
 
+def env_int(name: str, default_value: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default_value
+    try:
+        return int(value.strip())
+    except ValueError:
+        return default_value
+
+
+def env_float(name: str, default_value: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default_value
+    try:
+        return float(value.strip())
+    except ValueError:
+        return default_value
+
+
+BATCH_MAX = max(1, env_int("VOICEWAVE_BATCH_MAX", 8))
+BATCH_WAIT_MS = max(0, env_int("VOICEWAVE_BATCH_WAIT_MS", 0))
+# Extra CTranslate2 workers only pay off when transcribe() runs from several
+# threads at once; requests are decoded from one thread here, so default to
+# one. Mixed-core Windows and EPYC hosts may also schedule poorly with more.
+# 0 CPU threads leaves the OMP_NUM_THREADS cap set by the desktop client.
+MODEL_NUM_WORKERS = max(1, env_int("VOICEWAVE_NUM_WORKERS", 1))
+MODEL_CPU_THREADS = max(0, env_int("VOICEWAVE_CPU_THREADS", 0))
+# Bounds how many (model, device, compute type) combinations stay resident.
+# Repeating the same combination is always a cache hit and never evicts.
+MODEL_CACHE_SIZE = max(1, env_int("VOICEWAVE_MODEL_CACHE_SIZE", 2))
+# Silero VAD setup and chunking outweighs the decode itself on push-to-talk
+# sized clips, so VAD is skipped below this duration.
+VAD_MIN_SECONDS = max(0.0, env_float("VOICEWAVE_VAD_MIN_SECONDS", 3.0))
+
+
 def normalize_backend_preference(raw_backend: str | None) -> str:
     normalized = (raw_backend or "auto").strip().lower()
     if normalized in {"cpu", "cuda", "auto"}:
@@ -93,16 +208,91 @@ def cuda_available() -> bool:
     global GPU_CAPABILITY_CACHE
     if GPU_CAPABILITY_CACHE is not None:
         return GPU_CAPABILITY_CACHE
-    if ctranslate2 is None:
+    ct2 = import_ctranslate2()
+    if ct2 is None:
         GPU_CAPABILITY_CACHE = False
         return GPU_CAPABILITY_CACHE
     try:
-        GPU_CAPABILITY_CACHE = ctranslate2.get_cuda_device_count() > 0
+        GPU_CAPABILITY_CACHE = ct2.get_cuda_device_count() > 0
     except Exception:  # noqa: BLE001
         GPU_CAPABILITY_CACHE = False
     return GPU_CAPABILITY_CACHE
 
 
+def _cuda_probe_sidecar_path() -> Path:
+    cache_root = os.getenv("HF_HOME") or tempfile.gettempdir()
+    return Path(cache_root) / "voicewave-cuda-runtime.json"
+
+
+def _read_cuda_probe_sidecar() -> dict[str, str]:
+    try:
+        data = json.loads(_cuda_probe_sidecar_path().read_text(encoding="utf-8"))
+    except Exception:  # noqa: BLE001
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {key: value for key, value in data.items() if isinstance(value, str)}
+
+
+def _write_cuda_probe_sidecar(resolved: dict[str, str]) -> None:
+    try:
+        path = _cuda_probe_sidecar_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(resolved), encoding="utf-8")
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _loaded_dll_path(library) -> str | None:
+    try:
+        buffer = ctypes.create_unicode_buffer(32_768)
+        length = ctypes.windll.kernel32.GetModuleFileNameW(
+            ctypes.c_void_p(library._handle), buffer, len(buffer)
+        )
+    except Exception:  # noqa: BLE001
+        return None
+    return buffer.value if length else None
+
+
+def _recorded_cuda_dlls_loadable(recorded: dict[str, str]) -> bool:
+    # Loading by absolute path skips the library search but still fails when
+    # a dependency such as cublasLt went missing since the paths were recorded.
+    for dll in CUDA_RUNTIME_DLLS:
+        path = recorded.get(dll)
+        if not path or not Path(path).is_file():
+            return False
+        if hasattr(os, "add_dll_directory"):
+            try:
+                CUDA_DLL_DIR_HANDLES.append(os.add_dll_directory(str(Path(path).parent)))
+            except Exception:  # noqa: BLE001
+                pass
+        try:
+            ctypes.WinDLL(path)
+        except Exception:  # noqa: BLE001
+            return False
+    return True
+
+
+def _cuda_runtime_dlls_loadable() -> bool:
+    # A previous worker already resolved every DLL: load the recorded paths
+    # directly and only fall back to the full search when that fails.
+    if _recorded_cuda_dlls_loadable(_read_cuda_probe_sidecar()):
+        return True
+
+    resolved = {}
+    for dll in CUDA_RUNTIME_DLLS:
+        try:
+            library = ctypes.WinDLL(dll, winmode=LOAD_LIBRARY_SEARCH_DEFAULT_DIRS)
+        except Exception:  # noqa: BLE001
+            return False
+        path = _loaded_dll_path(library)
+        if path:
+            resolved[dll] = path
+    if len(resolved) == len(CUDA_RUNTIME_DLLS):
+        _write_cuda_probe_sidecar(resolved)
+    return True
+
+
 def cuda_runtime_libs_ready() -> bool:
     register_cuda_dll_dirs()
     global CUDA_RUNTIME_LIBS_READY_CACHE
@@ -111,60 +301,70 @@ def cuda_runtime_libs_ready() -> bool:
 
     # Avoid false positives: CTranslate2 may report CUDA support even when
     # cublas runtime DLL cannot be loaded at decode time.
-    required = ["cublas64_12.dll"]
-    for dll in required:
-        try:
-            ctypes.WinDLL(dll)
-        except Exception:  # noqa: BLE001
-            CUDA_RUNTIME_LIBS_READY_CACHE = False
-            return CUDA_RUNTIME_LIBS_READY_CACHE
+    if not _cuda_runtime_dlls_loadable():
+        CUDA_RUNTIME_LIBS_READY_CACHE = False
+        return CUDA_RUNTIME_LIBS_READY_CACHE
 
-    if ctranslate2 is not None:
-        try:
-            supported = ctranslate2.get_supported_compute_types("cuda")
-            if not supported:
-                CUDA_RUNTIME_LIBS_READY_CACHE = False
-                return CUDA_RUNTIME_LIBS_READY_CACHE
-        except Exception:  # noqa: BLE001
-            CUDA_RUNTIME_LIBS_READY_CACHE = False
-            return CUDA_RUNTIME_LIBS_READY_CACHE
+    if import_ctranslate2() is not None and not supported_compute_types("cuda"):
+        CUDA_RUNTIME_LIBS_READY_CACHE = False
+        return CUDA_RUNTIME_LIBS_READY_CACHE
     CUDA_RUNTIME_LIBS_READY_CACHE = True
     return CUDA_RUNTIME_LIBS_READY_CACHE
 
 
-def resolve_requested_backend(raw_backend: str | None) -> str:
+def _resolve_backend_map() -> dict[str, str]:
     if env_flag("VOICEWAVE_FORCE_CPU", False):
-        return "cpu"
+        return {"cpu": "cpu", "cuda": "cpu", "auto": "cpu"}
     if env_flag("VOICEWAVE_FORCE_GPU", False):
-        return "cuda"
+        return {"cpu": "cuda", "cuda": "cuda", "auto": "cuda"}
 
-    pref = normalize_backend_preference(raw_backend)
-    if pref == "cpu":
-        return "cpu"
-    if pref == "cuda":
-        return "cuda"
+    auto_backend = "cpu"
+    if env_flag("VOICEWAVE_AUTO_GPU", True) and cuda_available() and cuda_runtime_libs_ready():
+        auto_backend = "cuda"
+    return {"cpu": "cpu", "cuda": "cuda", "auto": auto_backend}
 
-    if not env_flag("VOICEWAVE_AUTO_GPU", True):
-        return "cpu"
-    if cuda_available() and cuda_runtime_libs_ready():
-        return "cuda"
-    return "cpu"
 
+def init_backend_map() -> None:
+    # Env flags, device count and DLL probes cannot change while the worker
+    # runs, so resolve every preference once instead of per request.
+    if not BACKEND_MAP:
+        BACKEND_MAP.update(_resolve_backend_map())
 
-def supported_compute_types(device: str) -> set[str]:
-    if ctranslate2 is None:
-        return set()
-    try:
-        return set(ctranslate2.get_supported_compute_types(device))
-    except Exception:  # noqa: BLE001
-        return set()
 
+def resolve_requested_backend(raw_backend: str | None) -> str:
+    if not BACKEND_MAP:
+        init_backend_map()
+    return BACKEND_MAP[normalize_backend_preference(raw_backend)]
 
+
+def supported_compute_types(device: str) -> frozenset[str]:
+    cached = SUPPORTED_COMPUTE_TYPES_CACHE.get(device)
+    if cached is not None:
+        return cached
+    supported = frozenset()
+    ct2 = import_ctranslate2()
+    if ct2 is not None:
+        try:
+            supported = frozenset(ct2.get_supported_compute_types(device))
+        except Exception:  # noqa: BLE001
+            pass
+    SUPPORTED_COMPUTE_TYPES_CACHE[device] = supported
+    return supported
+
+
+@functools.lru_cache(maxsize=16)
 def resolve_compute_type(device: str, requested_compute_type: str) -> str:
     requested = (requested_compute_type or "int8").strip().lower()
     supported = supported_compute_types(device)
     if not supported:
         return requested
+    if (
+        device == "cuda"
+        and requested == "int8"
+        and "int8_float16" in supported
+        and env_flag("VOICEWAVE_PREFER_INT8_FP16", False)
+    ):
+        return "int8_float16"
     if requested in supported:
         return requested
 
@@ -188,34 +388,180 @@ def resolve_compute_type(device: str, requested_compute_type: str) -> str:
     return requested
 
 
-def load_model(model_id: str, device: str, compute_type: str):
+def _pcm_scratch(sample_count: int) -> np.ndarray:
+    global _PCM_SCRATCH
+    if _PCM_SCRATCH is None or _PCM_SCRATCH.shape[0] < sample_count:
+        _PCM_SCRATCH = np.empty(sample_count, dtype=np.float32)
+    return _PCM_SCRATCH[:sample_count]
+
+
+def _pcm16_samples(audio_pcm16_b64: str) -> np.ndarray:
+    try:
+        pcm_bytes = base64.b64decode(audio_pcm16_b64)
+    except Exception as exc:
+        raise ValueError(f"Invalid in-memory PCM payload: {exc}") from exc
+    if len(pcm_bytes) % 2 != 0:
+        raise ValueError("Invalid in-memory PCM payload length.")
+    return np.frombuffer(pcm_bytes, dtype=np.int16)
+
+
+def _pcm16_to_float32(samples: np.ndarray) -> np.ndarray:
+    # Fuse the int16 -> float32 cast and the 1/32768 scale into one pass over a
+    # reused scratch buffer. The returned view is only valid until the next call.
+    return np.multiply(
+        samples,
+        PCM16_SCALE,
+        out=_pcm_scratch(samples.shape[0]),
+        dtype=np.float32,
+        casting="unsafe",
+    )
+
+
+def _read_audio_file(audio_path: str):
+    # Decode 16 kHz files with libsndfile instead of handing the path to
+    # faster-whisper, which spins up PyAV and its resampler per call. Other
+    # rates and formats keep going through faster-whisper's own decoder.
+    if soundfile is None:
+        return audio_path
+    try:
+        samples, sample_rate = soundfile.read(
+            audio_path, dtype="float32", always_2d=False
+        )
+    except Exception:  # noqa: BLE001
+        return audio_path
+    if sample_rate != SAMPLE_RATE_HZ:
+        return audio_path
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1, dtype=np.float32)
+    return samples
+
+
+def _audio_duration_seconds(audio_input) -> float | None:
+    if isinstance(audio_input, np.ndarray):
+        return audio_input.shape[0] / SAMPLE_RATE_HZ
+    try:
+        with wave.open(str(audio_input), "rb") as handle:
+            return handle.getnframes() / handle.getframerate()
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _skip_vad_for_short_audio(transcribe_kwargs: dict, audio_input) -> None:
+    if not transcribe_kwargs["vad_filter"]:
+        return
+    duration_s = _audio_duration_seconds(audio_input)
+    if duration_s is not None and duration_s < VAD_MIN_SECONDS:
+        transcribe_kwargs["vad_filter"] = False
+
+
+def _decode_float32_b64(audio_float32_b64: str) -> np.ndarray:
+    # Little-endian float32 samples, 16 kHz mono, already scaled to [-1, 1].
+    try:
+        sample_bytes = base64.b64decode(audio_float32_b64)
+    except Exception as exc:
+        raise ValueError(f"Invalid in-memory float32 payload: {exc}") from exc
+    if len(sample_bytes) % 4 != 0:
+        raise ValueError("Invalid in-memory float32 payload length.")
+    return np.frombuffer(sample_bytes, dtype="<f4")
+
+
+def _request_audio(req: dict):
+    # PCM16 payloads come back as raw int16 samples; the caller scales them
+    # into float32 wherever the samples end up.
+    audio_path = req.get("audioPath")
+    audio_pcm16_b64 = req.get("audioPcm16B64")
+    audio_float32_b64 = req.get("audioFloat32B64")
+    if isinstance(audio_pcm16_b64, str) and audio_pcm16_b64.strip():
+        return _pcm16_samples(audio_pcm16_b64)
+    if isinstance(audio_float32_b64, str) and audio_float32_b64.strip():
+        return _decode_float32_b64(audio_float32_b64)
+    if audio_path and Path(audio_path).exists():
+        return _read_audio_file(audio_path)
+    return None
+
+
+def _cached_model(key: tuple):
+    with MODEL_CACHE_LOCK:
+        model = MODEL_CACHE.get(key)
+        if model is not None:
+            MODEL_CACHE.move_to_end(key)
+        return model
+
+
+def _drop_models(models: list) -> None:
+    # CTranslate2 frees host and device memory when the last reference goes
+    # away; a decode still holding the model keeps it alive until it ends.
+    if not models:
+        return
+    models.clear()
+    gc.collect()
+
+
+def _evict_lru_models() -> None:
+    evicted = []
+    with MODEL_CACHE_LOCK:
+        while len(MODEL_CACHE) >= MODEL_CACHE_SIZE:
+            key, model = MODEL_CACHE.popitem(last=False)
+            BATCH_PIPELINE_CACHE.pop(key, None)
+            evicted.append(model)
+    _drop_models(evicted)
+
+
+def load_model(
+    model_id: str, device: str, compute_type: str, local_files_only: bool = False
+):
     key = (model_id, device, compute_type)
-    cached = MODEL_CACHE.get(key)
+    cached = _cached_model(key)
     if cached is not None:
         return cached, True, 0
 
+    import_faster_whisper()
     started = time.perf_counter()
-    model = WhisperModel(model_id, device=device, compute_type=compute_type)
-    load_ms = int((time.perf_counter() - started) * 1000)
-    MODEL_CACHE[key] = model
+    # Misses load one at a time so eviction and insertion see the same cache;
+    # parallel warm loads would otherwise both find room and overshoot
+    # VOICEWAVE_MODEL_CACHE_SIZE.
+    with MODEL_LOAD_LOCK:
+        # A startup warm load may have finished while this caller waited.
+        cached = _cached_model(key)
+        if cached is not None:
+            return cached, True, int((time.perf_counter() - started) * 1000)
+        # Weights missing from disk fail here, before anything is evicted.
+        model_source = model_id
+        if local_files_only:
+            model_source = download_model(model_id, local_files_only=True)
+        # Free the least recently used entries before allocating the new one
+        # so the old and new weights are never resident together. A load that
+        # still fails past the on-disk check loses them; the CUDA -> CPU
+        # fallback then loads whatever it needs.
+        _evict_lru_models()
+        model = WhisperModel(
+            model_source,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=MODEL_CPU_THREADS,
+            num_workers=MODEL_NUM_WORKERS,
+            local_files_only=local_files_only,
+        )
+        load_ms = int((time.perf_counter() - started) * 1000)
+        with MODEL_CACHE_LOCK:
+            MODEL_CACHE[key] = model
+    # Size the PCM staging buffer for a full Whisper window up front so
+    # push-to-talk clips never grow it on the decode path.
+    _pcm_scratch(WHISPER_WINDOW_SECONDS * SAMPLE_RATE_HZ)
     return model, False, load_ms
 
 
-def transcribe(req: dict) -> dict:
-    request_id = req.get("id")
-    audio_path = req.get("audioPath")
-    audio_pcm16_b64 = req.get("audioPcm16B64")
-    sample_rate_hz = int(req.get("sampleRateHz", 16_000))
-    model_id = req.get("modelId")
-    compute_type = req.get("computeType", "int8")
-    backend_preference = req.get("backendPreference", "auto")
-    allow_backend_fallback = bool(req.get("allowBackendFallback", True))
-    beam_size = int(req.get("beamSize", 2))
-    best_of = int(req.get("bestOf", 1))
-    language = req.get("language", "en")
-    vad_filter = bool(req.get("vadFilter", True))
-    condition_on_previous_text = bool(req.get("conditionOnPreviousText", False))
-    without_timestamps = bool(req.get("withoutTimestamps", False))
+def load_batched_pipeline(model_id: str, device: str, compute_type: str):
+    model, cache_hit, load_ms = load_model(model_id, device, compute_type)
+    key = (model_id, device, compute_type)
+    pipeline = BATCH_PIPELINE_CACHE.get(key)
+    if pipeline is None or pipeline.model is not model:
+        pipeline = BatchedInferencePipeline(model)
+        BATCH_PIPELINE_CACHE[key] = pipeline
+    return pipeline, cache_hit, load_ms
+
+
+def _transcribe_kwargs(req: dict) -> dict:
     initial_prompt = req.get("initialPrompt")
     temperature = req.get("temperature")
     no_speech_threshold = req.get("noSpeechThreshold")
@@ -226,18 +572,101 @@ def transcribe(req: dict) -> dict:
     else:
         initial_prompt = None
 
+    transcribe_kwargs = {
+        "beam_size": int(req.get("beamSize", 2)),
+        "best_of": int(req.get("bestOf", 1)),
+        "language": req.get("language", "en"),
+        "vad_filter": bool(req.get("vadFilter", True)),
+        "condition_on_previous_text": bool(req.get("conditionOnPreviousText", False)),
+        "without_timestamps": bool(req.get("withoutTimestamps", False)),
+        "initial_prompt": initial_prompt,
+    }
+    if temperature is not None:
+        transcribe_kwargs["temperature"] = float(temperature)
+    if no_speech_threshold is not None:
+        transcribe_kwargs["no_speech_threshold"] = float(no_speech_threshold)
+    if log_prob_threshold is not None:
+        transcribe_kwargs["log_prob_threshold"] = float(log_prob_threshold)
+    if compression_ratio_threshold is not None:
+        transcribe_kwargs["compression_ratio_threshold"] = float(
+            compression_ratio_threshold
+        )
+    return transcribe_kwargs
+
+
+def _summarize_segments(segments) -> dict:
+    parts = []
+    parts_append = parts.append
+    segment_count = 0
+    sum_avg_logprob = 0.0
+    sum_no_speech_prob = 0.0
+    sum_compression_ratio = 0.0
+    for segment in segments:
+        text = segment.text
+        if text:
+            text = text.strip()
+            if text:
+                parts_append(text)
+        sum_avg_logprob += segment.avg_logprob
+        sum_no_speech_prob += segment.no_speech_prob
+        sum_compression_ratio += segment.compression_ratio
+        segment_count += 1
+
+    if segment_count:
+        mean_avg_logprob = sum_avg_logprob / segment_count
+        mean_no_speech_prob = sum_no_speech_prob / segment_count
+        mean_compression_ratio = sum_compression_ratio / segment_count
+    else:
+        mean_avg_logprob = mean_no_speech_prob = mean_compression_ratio = 0.0
+
+    return {
+        "text": " ".join(parts),
+        "segmentCount": segment_count,
+        "avgLogProb": mean_avg_logprob,
+        "noSpeechProb": mean_no_speech_prob,
+        "compressionRatio": mean_compression_ratio,
+    }
+
+
+def _validate_request(req: dict) -> tuple[str | None, dict | None]:
+    model_id = req.get("modelId")
+    if model_id in ALLOWED_MODELS:
+        return model_id, None
     if not model_id:
-        return {
-            "id": request_id,
-            "ok": False,
-            "error": "Model ID is required.",
-        }
-    if model_id not in ALLOWED_MODELS:
-        return {
-            "id": request_id,
-            "ok": False,
-            "error": f"Unsupported model ID: {model_id}. Allowed: small.en, large-v3",
-        }
+        error = "Model ID is required."
+    else:
+        error = f"Unsupported model ID: {model_id}. {ALLOWED_MODELS_HINT}"
+    return None, {"id": req.get("id"), "ok": False, "error": error}
+
+
+def _stream_partials(segments, request_id):
+    # segmentIndex restarts at 0 if the decode falls back to CPU mid-stream, so
+    # clients should replace partials by index rather than append them.
+    for index, segment in enumerate(segments):
+        emit(
+            {
+                "id": request_id,
+                "partial": True,
+                "segmentIndex": index,
+                "text": (segment.text or "").strip(),
+                "start": segment.start,
+                "end": segment.end,
+            }
+        )
+        yield segment
+
+
+def transcribe(req: dict, audio_input=None) -> dict:
+    request_id = req.get("id")
+    sample_rate_hz = int(req.get("sampleRateHz", 16_000))
+    compute_type = req.get("computeType", "int8")
+    backend_preference = req.get("backendPreference", "auto")
+    allow_backend_fallback = bool(req.get("allowBackendFallback", True))
+    streaming = bool(req.get("streaming", False))
+
+    model_id, error_response = _validate_request(req)
+    if error_response is not None:
+        return error_response
     if sample_rate_hz != 16_000:
         return {
             "id": request_id,
@@ -245,31 +674,22 @@ def transcribe(req: dict) -> dict:
             "error": f"Unsupported sample rate: {sample_rate_hz}. Expected 16000 Hz.",
         }
 
-    audio_input = None
-    if isinstance(audio_pcm16_b64, str) and audio_pcm16_b64.strip():
+    if audio_input is None:
         try:
-            pcm_bytes = base64.b64decode(audio_pcm16_b64)
-        except Exception as exc:  # noqa: BLE001
-            return {
-                "id": request_id,
-                "ok": False,
-                "error": f"Invalid in-memory PCM payload: {exc}",
-            }
-        if len(pcm_bytes) % 2 != 0:
-            return {
-                "id": request_id,
-                "ok": False,
-                "error": "Invalid in-memory PCM payload length.",
-            }
-        audio_input = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-    elif audio_path and Path(audio_path).exists():
-        audio_input = audio_path
-    else:
+            audio_input = _request_audio(req)
+        except ValueError as exc:
+            return {"id": request_id, "ok": False, "error": str(exc)}
+    if audio_input is None:
         return {
             "id": request_id,
             "ok": False,
-            "error": "Audio payload is missing. Provide audioPcm16B64 or a valid audioPath.",
+            "error": (
+                "Audio payload is missing. Provide audioPcm16B64, audioFloat32B64, "
+                "or a valid audioPath."
+            ),
         }
+    if isinstance(audio_input, np.ndarray) and audio_input.dtype == np.int16:
+        audio_input = _pcm16_to_float32(audio_input)
 
     backend_requested = resolve_requested_backend(backend_preference)
     backend_used = backend_requested
@@ -277,25 +697,8 @@ def transcribe(req: dict) -> dict:
     compute_type_requested = str(compute_type)
     compute_type_used = resolve_compute_type(backend_used, compute_type_requested)
 
-    transcribe_kwargs = {
-        "beam_size": beam_size,
-        "best_of": best_of,
-        "language": language,
-        "vad_filter": vad_filter,
-        "condition_on_previous_text": condition_on_previous_text,
-        "without_timestamps": without_timestamps,
-        "initial_prompt": initial_prompt,
-    }
-    if temperature is not None:
-        transcribe_kwargs["temperature"] = float(temperature)
-    if no_speech_threshold is not None:
-        transcribe_kwargs["no_speech_threshold"] = float(no_speech_threshold)
-    if log_prob_threshold is not None:
-        transcribe_kwargs["log_prob_threshold"] = float(log_prob_threshold)
-    if compression_ratio_threshold is not None:
-        transcribe_kwargs["compression_ratio_threshold"] = float(
-            compression_ratio_threshold
-        )
+    transcribe_kwargs = _transcribe_kwargs(req)
+    _skip_vad_for_short_audio(transcribe_kwargs, audio_input)
 
     decode_started = time.perf_counter()
     runtime_cache_hit = False
@@ -305,7 +708,9 @@ def transcribe(req: dict) -> dict:
             model_id, backend_used, compute_type_used
         )
         segments, _info = model.transcribe(audio_input, **transcribe_kwargs)
-        segments = list(segments)
+        if streaming:
+            segments = _stream_partials(segments, request_id)
+        summary = _summarize_segments(segments)
     except Exception as first_err:  # noqa: BLE001
         if backend_used != "cuda" or not allow_backend_fallback:
             return {
@@ -324,7 +729,9 @@ def transcribe(req: dict) -> dict:
             model_init_ms += fallback_model_init_ms
             runtime_cache_hit = runtime_cache_hit and fallback_cache_hit
             segments, _info = fallback_model.transcribe(audio_input, **transcribe_kwargs)
-            segments = list(segments)
+            if streaming:
+                segments = _stream_partials(segments, request_id)
+            summary = _summarize_segments(segments)
         except Exception as fallback_err:  # noqa: BLE001
             return {
                 "id": request_id,
@@ -337,61 +744,218 @@ def transcribe(req: dict) -> dict:
 
     decode_ms = int((time.perf_counter() - decode_started) * 1000)
 
-    parts = []
-    avg_logprobs = []
-    no_speech_probs = []
-    compression_ratios = []
-    for segment in segments:
-        text = (segment.text or "").strip()
-        if text:
-            parts.append(text)
-        avg_logprobs.append(float(getattr(segment, "avg_logprob", 0.0)))
-        no_speech_probs.append(float(getattr(segment, "no_speech_prob", 0.0)))
-        compression_ratios.append(float(getattr(segment, "compression_ratio", 0.0)))
-
-    mean_avg_logprob = (
-        sum(avg_logprobs) / len(avg_logprobs) if avg_logprobs else 0.0
-    )
-    mean_no_speech_prob = (
-        sum(no_speech_probs) / len(no_speech_probs) if no_speech_probs else 0.0
-    )
-    mean_compression_ratio = (
-        sum(compression_ratios) / len(compression_ratios) if compression_ratios else 0.0
-    )
-
-    return {
+    response = {
         "id": request_id,
         "ok": True,
-        "text": " ".join(parts).strip(),
+        **summary,
         "modelInitMs": model_init_ms,
         "decodeComputeMs": decode_ms,
         "runtimeCacheHit": runtime_cache_hit,
-        "segmentCount": len(segments),
-        "avgLogProb": mean_avg_logprob,
-        "noSpeechProb": mean_no_speech_prob,
-        "compressionRatio": mean_compression_ratio,
         "backendRequested": backend_requested,
         "backendUsed": backend_used,
         "backendFallback": backend_fallback,
         "computeTypeRequested": compute_type_requested,
         "computeTypeUsed": compute_type_used,
     }
+    if streaming:
+        response["final"] = True
+    return response
+
+
+def _batch_candidate(req: dict) -> tuple:
+    # Returns (group key, decoded audio, requested compute type). A None key
+    # sends the request down the sequential path, reusing any audio that was
+    # already decoded here.
+    model_id = req.get("modelId")
+    if model_id not in ALLOWED_MODELS or req.get("streaming"):
+        return None, None, None
+    if int(req.get("sampleRateHz", 16_000)) != 16_000:
+        return None, None, None
+    try:
+        samples = _request_audio(req)
+    except ValueError:
+        return None, None, None
+    if not isinstance(samples, np.ndarray):
+        return None, samples, None
+    if not 0 < samples.shape[0] <= WHISPER_WINDOW_SECONDS * SAMPLE_RATE_HZ:
+        return None, samples, None
+    transcribe_kwargs = _transcribe_kwargs(req)
+    _skip_vad_for_short_audio(transcribe_kwargs, samples)
+    # The batched pipeline decodes each clip as a single window without VAD,
+    # so only clips that would be decoded that way anyway are grouped.
+    if transcribe_kwargs["vad_filter"]:
+        return None, samples, None
+
+    backend_used = resolve_requested_backend(req.get("backendPreference", "auto"))
+    compute_type_requested = str(req.get("computeType", "int8"))
+    compute_type_used = resolve_compute_type(backend_used, compute_type_requested)
+    key = (
+        model_id,
+        backend_used,
+        compute_type_used,
+        tuple(sorted(transcribe_kwargs.items())),
+    )
+    return key, samples, compute_type_requested
+
+
+def _run_batch(key: tuple, members: list) -> list[dict]:
+    model_id, backend_used, compute_type_used, kwargs_items = key
+    transcribe_kwargs = dict(kwargs_items)
+
+    decode_started = time.perf_counter()
+    pipeline, runtime_cache_hit, model_init_ms = load_batched_pipeline(
+        model_id, backend_used, compute_type_used
+    )
+
+    # Lay clips out on whole-second boundaries so each segment's seek maps
+    # straight back to the clip it was decoded from.
+    offsets = []
+    total_samples = 0
+    for _index, samples, _compute_type_requested in members:
+        offsets.append(total_samples)
+        slot_seconds = -(-samples.shape[0] // SAMPLE_RATE_HZ)
+        total_samples += slot_seconds * SAMPLE_RATE_HZ
+    audio = np.zeros(total_samples, dtype=np.float32)
+    clip_timestamps = []
+    for offset, (_index, samples, _compute_type_requested) in zip(offsets, members):
+        end = offset + samples.shape[0]
+        if samples.dtype == np.int16:
+            np.multiply(
+                samples,
+                PCM16_SCALE,
+                out=audio[offset:end],
+                dtype=np.float32,
+                casting="unsafe",
+            )
+        else:
+            audio[offset:end] = samples
+        clip_timestamps.append(
+            {"start": offset / SAMPLE_RATE_HZ, "end": end / SAMPLE_RATE_HZ}
+        )
+
+    frames_per_second = pipeline.model.frames_per_second
+    position_by_seek = {
+        offset // SAMPLE_RATE_HZ * frames_per_second: position
+        for position, offset in enumerate(offsets)
+    }
+    segments, _info = pipeline.transcribe(
+        audio,
+        clip_timestamps=clip_timestamps,
+        batch_size=len(members),
+        **transcribe_kwargs,
+    )
+
+    # The batched pipeline skips the no-speech check that the sequential
+    # decoder applies, so mirror it here to keep results equivalent.
+    no_speech_threshold = transcribe_kwargs.get("no_speech_threshold", 0.6)
+    log_prob_threshold = transcribe_kwargs.get("log_prob_threshold", -1.0)
+    grouped = [[] for _ in members]
+    for segment in segments:
+        if (
+            no_speech_threshold is not None
+            and segment.no_speech_prob > no_speech_threshold
+            and (log_prob_threshold is None or segment.avg_logprob <= log_prob_threshold)
+        ):
+            continue
+        grouped[position_by_seek[segment.seek]].append(segment)
+    decode_ms = int((time.perf_counter() - decode_started) * 1000)
+
+    return [
+        {
+            "ok": True,
+            **_summarize_segments(clip_segments),
+            "modelInitMs": model_init_ms,
+            "decodeComputeMs": decode_ms,
+            "runtimeCacheHit": runtime_cache_hit,
+            "backendRequested": backend_used,
+            "backendUsed": backend_used,
+            "backendFallback": False,
+            "computeTypeRequested": compute_type_requested,
+            "computeTypeUsed": compute_type_used,
+            "batchSize": len(members),
+        }
+        for clip_segments, (_index, _samples, compute_type_requested) in zip(
+            grouped, members
+        )
+    ]
+
+
+def _worker_error(req: dict, exc: Exception) -> dict:
+    return {
+        "id": req.get("id"),
+        "ok": False,
+        "error": f"Worker exception: {exc}",
+        "traceback": traceback.format_exc(),
+    }
+
+
+def _transcribe_one(req: dict, audio_input=None) -> dict:
+    # Requests drained together still succeed or fail on their own, so one
+    # malformed line never costs the others their responses.
+    try:
+        return transcribe(req, audio_input)
+    except Exception as exc:  # noqa: BLE001
+        return _worker_error(req, exc)
+
+
+def transcribe_batch(reqs: list[dict]):
+    # Yields one response per request in arrival order as soon as it is ready,
+    # so a later streaming or sequential request never delays earlier finals.
+    if len(reqs) > 1:
+        try:
+            import_faster_whisper()
+        except Exception:  # noqa: BLE001
+            pass
+    if len(reqs) == 1 or BatchedInferencePipeline is None:
+        for req in reqs:
+            yield _transcribe_one(req)
+        return
+
+    responses: list[dict | None] = [None] * len(reqs)
+    plans: list[tuple | None] = [None] * len(reqs)
+    groups: dict[tuple, list] = {}
+    for index, req in enumerate(reqs):
+        try:
+            key, samples, compute_type_requested = _batch_candidate(req)
+        except Exception as exc:  # noqa: BLE001
+            responses[index] = _worker_error(req, exc)
+            continue
+        plans[index] = (key, samples)
+        if key is not None:
+            groups.setdefault(key, []).append((index, samples, compute_type_requested))
+
+    for index, req in enumerate(reqs):
+        if responses[index] is None:
+            key, samples = plans[index]
+            members = groups.get(key) if key is not None else None
+            batch_responses = None
+            if members is not None and len(members) > 1:
+                try:
+                    batch_responses = _run_batch(key, members)
+                except Exception:  # noqa: BLE001
+                    # Let each member retry on the sequential path, in its own
+                    # turn, with its own backend fallback and error reporting.
+                    groups.pop(key)
+            if batch_responses is None:
+                responses[index] = _transcribe_one(req, samples)
+            else:
+                for member, response in zip(members, batch_responses):
+                    member_index = member[0]
+                    responses[member_index] = {
+                        "id": reqs[member_index].get("id"),
+                        **response,
+                    }
+        yield responses[index]
 
 
 def prefetch(req: dict) -> dict:
     request_id = req.get("id")
-    model_id = req.get("modelId")
     compute_type = req.get("computeType", "int8")
     backend_preference = req.get("backendPreference", "auto")
     allow_backend_fallback = bool(req.get("allowBackendFallback", True))
-    if not model_id:
-        return {"id": request_id, "ok": False, "error": "Model ID is required."}
-    if model_id not in ALLOWED_MODELS:
-        return {
-            "id": request_id,
-            "ok": False,
-            "error": f"Unsupported model ID: {model_id}. Allowed: small.en, large-v3",
-        }
+    model_id, error_response = _validate_request(req)
+    if error_response is not None:
+        return error_response
     backend_requested = resolve_requested_backend(backend_preference)
     backend_used = backend_requested
     backend_fallback = False
@@ -441,49 +1005,199 @@ def prefetch(req: dict) -> dict:
     }
 
 
-def main() -> int:
-    print(json.dumps({"ready": True}), flush=True)
-    for line in sys.stdin:
-        raw = line.strip()
-        if not raw:
+def release(req: dict) -> dict:
+    model_id, error_response = _validate_request(req)
+    if error_response is not None:
+        return error_response
+    backend_used = req.get("backendUsed")
+    compute_type_used = req.get("computeTypeUsed")
+    released = []
+    models = []
+    with MODEL_CACHE_LOCK:
+        for key in list(MODEL_CACHE):
+            cached_model_id, device, compute_type = key
+            if cached_model_id != model_id:
+                continue
+            if backend_used and device != backend_used:
+                continue
+            if compute_type_used and compute_type != compute_type_used:
+                continue
+            models.append(MODEL_CACHE.pop(key))
+            BATCH_PIPELINE_CACHE.pop(key, None)
+            released.append(list(key))
+    _drop_models(models)
+    return {"id": req.get("id"), "ok": True, "released": released}
+
+
+def _warm_load(model_id: str) -> None:
+    # Mirror the desktop client's request defaults so the warmed entry is the
+    # one the first transcribe or prefetch hits. Never download from here.
+    if env_flag("VOICEWAVE_FORCE_CPU", False) or not env_flag("VOICEWAVE_AUTO_GPU", True):
+        backend_preference = "cpu"
+        requested = os.getenv("VOICEWAVE_FW_CPU_COMPUTE_TYPE", "").strip() or "int8_float32"
+    else:
+        backend_preference = "auto"
+        requested = os.getenv("VOICEWAVE_FW_GPU_COMPUTE_TYPE", "").strip() or "int8"
+    try:
+        device = resolve_requested_backend(backend_preference)
+        # large-v3 is only warmed on CUDA. On CPU it would take gigabytes of
+        # RAM and compete with the first small.en decode after every respawn.
+        if model_id == "large-v3" and device != "cuda":
+            return
+        compute_type = resolve_compute_type(device, requested)
+        load_model(model_id, device, compute_type, local_files_only=True)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def start_warm_loads() -> None:
+    raw_models = os.getenv("VOICEWAVE_WARM_MODELS", "small.en,large-v3")
+    for model_id in raw_models.split(","):
+        model_id = model_id.strip()
+        if model_id not in ALLOWED_MODELS:
             continue
+        threading.Thread(target=_warm_load, args=(model_id,), daemon=True).start()
+
+
+def _loads(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def emit(payload: dict) -> None:
+    # One frame per line: JSON serializers escape embedded newlines, and
+    # orjson appends the terminator while encoding instead of via a copy.
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload) + "\n").encode("utf-8")
+    WRITER_QUEUE.put(data)
+
+
+def _write_responses() -> None:
+    # Pipe writes happen here so the decode thread can go straight back to
+    # the next request. After a write error keep draining so emit() never
+    # blocks on a full queue; the stdin EOF that follows ends the worker.
+    stdout_fd = sys.stdout.fileno()
+    broken = False
+    while True:
+        data = WRITER_QUEUE.get()
+        if data is None:
+            return
+        if broken:
+            continue
+        view = memoryview(data)
         try:
-            req = json.loads(raw)
-            command = req.get("command", "transcribe")
-            if command == "shutdown":
-                print(json.dumps({"ok": True, "shutdown": True}), flush=True)
-                return 0
-            if command == "prefetch":
-                print(json.dumps(prefetch(req)), flush=True)
+            while view:
+                view = view[os.write(stdout_fd, view):]
+        except OSError:
+            broken = True
+
+
+def _read_stdin(pending: queue.Queue) -> None:
+    # Audio payloads arrive as multi-megabyte base64 lines; read them through a
+    # large binary buffer instead of the text-mode line iterator.
+    reader = io.BufferedReader(sys.stdin.buffer.raw, buffer_size=1 << 20)
+    for line in iter(reader.readline, b""):
+        pending.put(line)
+    pending.put(None)
+
+
+def _drain_pending(pending: queue.Queue, lines: list[bytes]) -> bool:
+    deadline = time.monotonic() + BATCH_WAIT_MS / 1000
+    while len(lines) < BATCH_MAX:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                line = pending.get(timeout=remaining)
+            else:
+                line = pending.get_nowait()
+        except queue.Empty:
+            return False
+        if line is None:
+            return True
+        lines.append(line)
+    return False
+
+
+def _flush_transcribes(batch: list[dict]) -> None:
+    if not batch:
+        return
+    emitted = 0
+    try:
+        for response in transcribe_batch(batch):
+            emit(response)
+            emitted += 1
+    except Exception as exc:  # noqa: BLE001
+        for req in batch[emitted:]:
+            emit(_worker_error(req, exc))
+    batch.clear()
+
+
+def _serve(pending: queue.Queue) -> int:
+    while True:
+        line = pending.get()
+        if line is None:
+            return 0
+        lines = [line]
+        stdin_closed = _drain_pending(pending, lines)
+
+        batch: list[dict] = []
+        for line in lines:
+            raw = line.strip()
+            if not raw:
                 continue
-            if command != "transcribe":
-                print(
-                    json.dumps(
-                        {
-                            "id": req.get("id"),
-                            "ok": False,
-                            "error": f"Unsupported command: {command}",
-                        }
-                    ),
-                    flush=True,
+            try:
+                req = _loads(raw)
+                command = req.get("command", "transcribe")
+                if command == "transcribe":
+                    batch.append(req)
+                    continue
+                _flush_transcribes(batch)
+                if command == "shutdown":
+                    emit({"ok": True, "shutdown": True})
+                    return 0
+                if command == "prefetch":
+                    emit(prefetch(req))
+                    continue
+                if command == "release":
+                    emit(release(req))
+                    continue
+                emit(
+                    {
+                        "id": req.get("id"),
+                        "ok": False,
+                        "error": f"Unsupported command: {command}",
+                    }
                 )
-                continue
-
-            response = transcribe(req)
-            print(json.dumps(response), flush=True)
-        except Exception as exc:  # noqa: BLE001
-            print(
-                json.dumps(
+            except Exception as exc:  # noqa: BLE001
+                emit(
                     {
                         "id": None,
                         "ok": False,
                         "error": f"Worker exception: {exc}",
                         "traceback": traceback.format_exc(),
                     }
-                ),
-                flush=True,
-            )
-    return 0
+                )
+        _flush_transcribes(batch)
+        if stdin_closed:
+            return 0
+
+
+def main() -> int:
+    writer = threading.Thread(target=_write_responses, daemon=True)
+    writer.start()
+    emit({"ready": True})
+    init_backend_map()
+    start_warm_loads()
+    pending: queue.Queue = queue.Queue()
+    threading.Thread(target=_read_stdin, args=(pending,), daemon=True).start()
+    try:
+        return _serve(pending)
+    finally:
+        WRITER_QUEUE.put(None)
+        writer.join()
 
 
 if __name__ == "__main__":